@@ -0,0 +1,26 @@
+import re
+from scripts.utils import Timer
+from ural.normalize_url import IRRELEVANT_QUERY_PATTERN, AMP_QUERY_PATTERN
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+N = 1_000_000
+KEYS = ['utm_source', 'page', 'fbclid', 'id', 'amp_analytics', 'xtor']
+
+PATTERN = IRRELEVANT_QUERY_PATTERN % AMP_QUERY_PATTERN
+
+pattern = re.compile(PATTERN, re.I)
+with Timer('re'):
+    for _ in range(N):
+        for key in KEYS:
+            pattern.match(key)
+
+if re2 is not None:
+    pattern = re2.compile('(?i)' + PATTERN)
+    with Timer('re2'):
+        for _ in range(N):
+            for key in KEYS:
+                pattern.match(key)
@@ -0,0 +1,34 @@
+import re
+from scripts.utils import Timer
+from ural.normalize_url import QUERY_TO_PROCESS_RE
+
+N = 1_000_000
+URL = 'https://www.lemonde.fr/article/2018/07/17/some-title/index.html?utm_source=twitter&id=3#anchor'
+QUERY = 'utm_source=twitter&id=3'
+
+BYTES_QUERY_TO_PROCESS_RE = re.compile(
+    QUERY_TO_PROCESS_RE.pattern.encode('ascii'),
+    re.I
+)
+
+with Timer('regex on str'):
+    for _ in range(N):
+        QUERY_TO_PROCESS_RE.search(QUERY)
+
+query = QUERY.encode('ascii')
+with Timer('regex on bytes'):
+    for _ in range(N):
+        BYTES_QUERY_TO_PROCESS_RE.search(query)
+
+with Timer('slicing str'):
+    for _ in range(N):
+        URL[8:22]
+
+url = URL.encode('ascii')
+with Timer('slicing bytes'):
+    for _ in range(N):
+        url[8:22]
+
+with Timer('encoding & decoding'):
+    for _ in range(N):
+        URL.encode('ascii').decode('ascii')
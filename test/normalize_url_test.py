@@ -2,7 +2,7 @@
 # =============================================================================
 # Ural URL Normalization Unit Tests
 # =============================================================================
-from ural import normalize_url, get_normalized_hostname, get_hostname
+from ural import normalize_url, normalize_urls, get_normalized_hostname, get_hostname
 
 TESTS = [
     ('http://lemonde.fr///a/./b/..', 'lemonde.fr/a'),
@@ -144,6 +144,13 @@ class TestNormalizeUrl(object):
         for url, normalized, kwargs in TESTS_ADVANCED:
             assert normalize_url(url, **kwargs) == normalized, '*kwargs %s' % url
 
+    def test_normalize_urls(self):
+        urls = [url for url, _ in TESTS]
+        assert normalize_urls(urls) == [normalized for _, normalized in TESTS]
+
+        for url, normalized, kwargs in TESTS_ADVANCED:
+            assert normalize_urls([url], **kwargs) == [normalized], '*kwargs %s' % url
+
     def test_get_normalized_hostname(self):
         for url, normalized in TESTS:
             assert get_normalized_hostname(url) == get_hostname(normalized)
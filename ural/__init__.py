@@ -9,7 +9,7 @@ from ural.infer_redirection import infer_redirection
 from ural.is_shortened_url import is_shortened_url
 from ural.is_typo_url import is_typo_url
 from ural.is_url import is_url
-from ural.normalize_url import normalize_url, get_normalized_hostname
+from ural.normalize_url import normalize_url, normalize_urls, get_normalized_hostname
 from ural.strip_protocol import strip_protocol
 from ural.tries import HostnameTrieSet
 from ural.urls_from_text import urls_from_text
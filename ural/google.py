@@ -18,23 +18,23 @@ DRIVE_TYPES = ['document', 'presentation', 'spreadsheets']
 
 def is_amp_url(url):
     splitted = safe_urlsplit(url)
+    hostname = splitted.hostname or ''
 
-    if splitted.hostname.endswith('.ampproject.org'):
-        return True
-
-    if splitted.hostname.startswith('amp-'):
-        return True
-
-    if splitted.hostname.startswith('amp.'):
+    if hostname.endswith('.ampproject.org') or hostname.startswith(('amp-', 'amp.')):
         return True
 
     if '/amp/' in splitted.path:
         return True
 
-    if AMP_SUFFIXES_RE.search(splitted.path):
+    # NOTE: AMP suffixes can only be found at the very end of the path
+    if 'amp' in splitted.path[-9:].lower() and AMP_SUFFIXES_RE.search(splitted.path):
         return True
 
-    if splitted.query and AMP_QUERY_RE.search(splitted.query):
+    if (
+        splitted.query and
+        'amp' in splitted.query.lower() and
+        AMP_QUERY_RE.search(splitted.query)
+    ):
         return True
 
     return False
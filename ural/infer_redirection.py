@@ -30,20 +30,24 @@ def infer_redirection(url, recursive=True):
         string: Redirected url or the original url if nothing was found.
     """
 
-    redirection_split = REDIRECTION_DOMAINS_RE.split(url, 1)
-
     target = None
 
-    if len(redirection_split) > 1:
-        target = 'https://' + redirection_split[1]
+    lowered_url = url.lower()
+
+    # NOTE: substring tests are way cheaper than running the regexes
+    if 'ampproject' in lowered_url or 'marfeel' in lowered_url:
+        redirection_domain_match = REDIRECTION_DOMAINS_RE.search(url)
+
+        if redirection_domain_match is not None:
+            target = 'https://' + url[redirection_domain_match.end():]
 
-    else:
-        obvious_redirect_match = re.search(OBVIOUS_REDIRECTS_RE, url)
+    if target is None and '=' in url:
+        obvious_redirect_match = OBVIOUS_REDIRECTS_RE.search(url)
 
         if obvious_redirect_match is not None:
             potential_target = unquote(obvious_redirect_match.group(1))
 
-            if potential_target.startswith('http://') or potential_target.startswith('https://'):
+            if potential_target.startswith(('http://', 'https://')):
                 target = potential_target
 
             if potential_target.startswith('/'):
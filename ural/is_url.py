@@ -5,14 +5,8 @@
 # A function returning True if its argument is a url.
 #
 from tld.utils import process_url
-from ural.patterns import (
-    URL_RE,
-    URL_WITH_PROTOCOL_RE,
-    RELAXED_URL,
-    RELAXED_URL_WITH_PROTOCOL_RE,
-    HTTP_PROTOCOL_RE,
-    SPECIAL_HOSTS_RE
-)
+from ural import patterns
+from ural.patterns import HTTP_PROTOCOL_RE, SPECIAL_HOSTS_RE
 
 
 def is_url(string, require_protocol=True, tld_aware=False,
@@ -46,14 +40,14 @@ def is_url(string, require_protocol=True, tld_aware=False,
             return False
 
         if allow_spaces_in_path:
-            pattern = RELAXED_URL_WITH_PROTOCOL_RE
+            pattern = patterns.RELAXED_URL_WITH_PROTOCOL_RE
         else:
-            pattern = URL_WITH_PROTOCOL_RE
+            pattern = patterns.URL_WITH_PROTOCOL_RE
     else:
         if allow_spaces_in_path:
-            pattern = RELAXED_URL
+            pattern = patterns.RELAXED_URL
         else:
-            pattern = URL_RE
+            pattern = patterns.URL_RE
 
     if not pattern.match(string):
         return False
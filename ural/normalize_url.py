@@ -7,7 +7,7 @@
 #
 import re
 import pycountry
-from os.path import splitext
+from collections import namedtuple
 
 from ural.ensure_protocol import ensure_protocol
 from ural.infer_redirection import infer_redirection as resolve
@@ -19,6 +19,7 @@ from ural.utils import (
     decode_punycode_hostname,
     unquote,
     normpath,
+    lru_cache,
     SplitResult
 )
 from ural.patterns import PROTOCOL_RE
@@ -27,27 +28,41 @@ RESERVED_CHARACTERS = ';,/?:@&=+$'
 UNRESERVED_CHARACTERS = '-_.!~*\'()'
 SAFE_CHARACTERS = RESERVED_CHARACTERS + UNRESERVED_CHARACTERS
 
+# NOTE: characters that `quote` always leaves untouched, except for "~" which
+# is only considered safe since python 3.7
+ALWAYS_SAFE_CHARACTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-'
+ALWAYS_SAFE_PATH_CHARACTERS = ALWAYS_SAFE_CHARACTERS + '/'
+ALWAYS_SAFE_QUERY_CHARACTERS = ALWAYS_SAFE_CHARACTERS + RESERVED_CHARACTERS
+ALWAYS_SAFE_FRAGMENT_CHARACTERS = ALWAYS_SAFE_CHARACTERS + SAFE_CHARACTERS
+
 MISTAKES_RE = re.compile(r'&amp(?:%3B|;)', re.I)
 
-IRRELEVANT_QUERY_PATTERN = r'^(?:__twitter_impression|_guc_consent_skip|guccounter|echobox|fbclid|feature|refid|__tn__|fb_source|_ft_|recruiter|fref|igshid|wpamp|ncid|utm_.+%s|s?een|xt(?:loc|ref|cr|np|or|s))$'
+IRRELEVANT_QUERY_PATTERN = r'^(?:__twitter_impression|_guc_consent_skip|guccounter|echobox|fbclid|feature|refid|__tn__|fb_source|_ft_|recruiter|fref|igshid|wpamp|ncid|utm_[^=]+%s|s?een|xt(?:loc|ref|cr|np|or|s))$'
 IRRELEVANT_SUBDOMAIN_PATTERN = r'\b(?:www\d?|mobile%s|m)\.'
 
-AMP_QUERY_PATTERN = r'|amp_.+|amp'
+AMP_QUERY_PATTERN = r'|amp_[^=]+|amp'
 AMP_SUBDOMAIN_PATTERN = r'|amp'
-AMP_SUFFIXES_RE = re.compile(r'(?:\.amp(?=\.html$)|\.amp/?$|(?<=/)amp/?$)', re.I)
 
-IRRELEVANT_QUERY_RE = re.compile(IRRELEVANT_QUERY_PATTERN % r'', re.I)
 IRRELEVANT_SUBDOMAIN_RE = re.compile(IRRELEVANT_SUBDOMAIN_PATTERN % r'', re.I)
 
-IRRELEVANT_QUERY_AMP_RE = re.compile(IRRELEVANT_QUERY_PATTERN % AMP_QUERY_PATTERN, re.I)
 IRRELEVANT_SUBDOMAIN_AMP_RE = re.compile(IRRELEVANT_SUBDOMAIN_PATTERN % AMP_SUBDOMAIN_PATTERN, re.I)
 
+# NOTE: the following mirror the subdomain patterns above so that the
+# common case can be handled without running a regex
+IRRELEVANT_SUBDOMAINS = frozenset(
+    ['www.', 'mobile.', 'm.'] + ['www%i.' % i for i in range(10)]
+)
+IRRELEVANT_SUBDOMAINS_AMP = IRRELEVANT_SUBDOMAINS | frozenset(['amp.'])
+
+IRRELEVANT_SUBDOMAIN_MARKERS = ('www', 'mobile.', 'm.')
+IRRELEVANT_SUBDOMAIN_AMP_MARKERS = IRRELEVANT_SUBDOMAIN_MARKERS + ('amp.', )
+
 IRRELEVANT_QUERY_COMBOS = {
-    'marfeeltn': ('amp', ),
-    'mode': ('amp', ),
-    'output': ('amp', ),
-    'platform': ('hootsuite', ),
-    'ref': set([
+    'marfeeltn': frozenset(['amp']),
+    'mode': frozenset(['amp']),
+    'output': frozenset(['amp']),
+    'platform': frozenset(['hootsuite']),
+    'ref': frozenset([
         'bookmark',
         'bookmarks',
         'distributor_share',
@@ -66,10 +81,37 @@ IRRELEVANT_QUERY_COMBOS = {
         'viral',
         'feed'
     ]),
-    'sns': ('tw', ),
-    'spref': ('fb', 'ts', 'tw', 'tw_i', 'twitter')
+    'sns': frozenset(['tw']),
+    'spref': frozenset(['fb', 'ts', 'tw', 'tw_i', 'twitter'])
 }
 
+# NOTE: matched against "key=value" strings, with lowercased keys, so that
+# a single regex can tell whether a query item should be stripped
+IRRELEVANT_QUERY_COMBOS_PATTERN = '|'.join(
+    '%s=(?:%s)' % (key, '|'.join(re.escape(value) for value in sorted(values)))
+    for key, values in sorted(IRRELEVANT_QUERY_COMBOS.items())
+)
+IRRELEVANT_QUERY_ITEM_TEMPLATE = r'(?:%s)(?:=|\Z)|(?:%s)\Z'
+
+IRRELEVANT_QUERY_ITEM_RE = re.compile(IRRELEVANT_QUERY_ITEM_TEMPLATE % (
+    IRRELEVANT_QUERY_PATTERN[1:-1] % r'',
+    IRRELEVANT_QUERY_COMBOS_PATTERN
+))
+IRRELEVANT_QUERY_ITEM_AMP_RE = re.compile(IRRELEVANT_QUERY_ITEM_TEMPLATE % (
+    IRRELEVANT_QUERY_PATTERN[1:-1] % AMP_QUERY_PATTERN,
+    IRRELEVANT_QUERY_COMBOS_PATTERN
+))
+
+# NOTE: matches any query that would be altered by the parse_qsl round-trip
+# or that could contain irrelevant items, so we can avoid processing the rest
+QUERY_TO_PROCESS_RE = re.compile(
+    r'[%%+;]|&&|=&|^&|[&=]$|(?:^|&)(?:%s|%s)(?:=|&|$)' % (
+        IRRELEVANT_QUERY_PATTERN[1:-1] % AMP_QUERY_PATTERN,
+        '|'.join(IRRELEVANT_QUERY_COMBOS)
+    ),
+    re.I
+)
+
 PER_DOMAIN_QUERY_FILTERS = [
     ('twitter.com', lambda k, v: k == 's'),
     ('facebook.com', lambda k, v: k == '_rdc' or k == '_rdr')
@@ -77,6 +119,46 @@ PER_DOMAIN_QUERY_FILTERS = [
 
 LANG_QUERY_KEYS = ('gl', 'hl')
 
+NORMALIZE_URL_CACHE_SIZE = 65536
+
+NormalizeUrlOptions = namedtuple('NormalizeUrlOptions', [
+    'unsplit',
+    'sort_query',
+    'strip_authentication',
+    'strip_trailing_slash',
+    'strip_index',
+    'strip_protocol',
+    'strip_irrelevant_subdomains',
+    'strip_lang_subdomains',
+    'strip_lang_query_items',
+    'strip_fragment',
+    'normalize_amp',
+    'fix_common_mistakes',
+    'infer_redirection',
+    'quoted'
+])
+
+# NOTE: keep in sync with normalize_url's defaults
+NormalizeUrlOptions.__new__.__defaults__ = (
+    True,
+    True,
+    True,
+    True,
+    True,
+    True,
+    True,
+    False,
+    False,
+    'except-routing',
+    True,
+    True,
+    True,
+    True
+)
+
+# NOTE: pycountry lookups are costly, so we index ISO alpha_2 codes once
+COUNTRY_CODES = frozenset(country.alpha_2 for country in pycountry.countries)
+
 
 def stringify_qs(item):
     if item[1] == '':
@@ -87,17 +169,18 @@ def stringify_qs(item):
 
 def should_strip_query_item(item, normalize_amp=True, strip_lang_query_items=False,
                             domain_filter=None):
-    key = item[0].lower()
+    key = item[0]
 
-    pattern = IRRELEVANT_QUERY_AMP_RE if normalize_amp else IRRELEVANT_QUERY_RE
-
-    if pattern.match(key):
-        return True
+    # NOTE: most keys are already lowercase, which spares an allocation
+    if not key.islower():
+        key = key.lower()
 
     value = item[1]
 
-    if key in IRRELEVANT_QUERY_COMBOS:
-        return value in IRRELEVANT_QUERY_COMBOS[key]
+    pattern = IRRELEVANT_QUERY_ITEM_AMP_RE if normalize_amp else IRRELEVANT_QUERY_ITEM_RE
+
+    if pattern.match(key + '=' + value):
+        return True
 
     if strip_lang_query_items and key in LANG_QUERY_KEYS:
         return True
@@ -112,23 +195,73 @@ def should_strip_fragment(fragment):
     if fragment == '!/' or fragment == '/' or fragment == '!':
         return False
 
-    return (
-        fragment.startswith('/') or
-        fragment.startswith('!')
-    )
+    return fragment.startswith(('/', '!'))
+
+
+def strip_irrelevant_subdomains_from_netloc(netloc, normalize_amp=True):
+    if normalize_amp:
+        subdomains = IRRELEVANT_SUBDOMAINS_AMP
+        markers = IRRELEVANT_SUBDOMAIN_AMP_MARKERS
+        pattern = IRRELEVANT_SUBDOMAIN_AMP_RE
+    else:
+        subdomains = IRRELEVANT_SUBDOMAINS
+        markers = IRRELEVANT_SUBDOMAIN_MARKERS
+        pattern = IRRELEVANT_SUBDOMAIN_RE
+
+    lowered_netloc = netloc.lower()
+
+    # Leading subdomain, e.g. "www.lemonde.fr"
+    subdomain = lowered_netloc[:lowered_netloc.find('.') + 1]
+
+    if subdomain in subdomains:
+        netloc = netloc[len(subdomain):]
+        lowered_netloc = lowered_netloc[len(subdomain):]
+
+    # Remaining subdomains, e.g. "en.m.wikipedia.org", are left to the regex
+    for marker in markers:
+        if marker in lowered_netloc:
+            return pattern.sub('', netloc)
+
+    return netloc
+
+
+def strip_amp_suffixes_from_path(path):
+    suffix = path[-9:].lower()
+
+    if suffix == '.amp.html':
+        return path[:-9] + path[-5:]
+
+    if suffix.endswith('.amp'):
+        return path[:-4]
+
+    if suffix.endswith('.amp/'):
+        return path[:-5]
+
+    if suffix.endswith('/amp'):
+        return path[:-3]
+
+    if suffix.endswith('/amp/'):
+        return path[:-4]
+
+    return path
 
 
 def strip_lang_subdomains_from_netloc(netloc):
-    if netloc.count('.') > 1:
-        subdomain, remaining_netloc = netloc.split('.', 1)
-        if len(subdomain) == 5 and '-' in subdomain:
-            lang, country = subdomain.split('-', 1)
-            if len(lang) == 2 and len(country) == 2:
-                if pycountry.countries.get(alpha_2=lang.upper()) and pycountry.countries.get(alpha_2=country.upper()):
-                    netloc = remaining_netloc
-        elif len(subdomain) == 2:
-            if pycountry.countries.get(alpha_2=subdomain.upper()):
-                netloc = remaining_netloc
+    first_dot = netloc.find('.')
+
+    if first_dot == -1 or netloc.find('.', first_dot + 1) == -1:
+        return netloc
+
+    subdomain = netloc[:first_dot]
+
+    if len(subdomain) == 5 and '-' in subdomain:
+        lang, country = subdomain.split('-', 1)
+        if len(lang) == 2 and len(country) == 2:
+            if lang.upper() in COUNTRY_CODES and country.upper() in COUNTRY_CODES:
+                return netloc[first_dot + 1:]
+    elif len(subdomain) == 2:
+        if subdomain.upper() in COUNTRY_CODES:
+            return netloc[first_dot + 1:]
 
     return netloc
 
@@ -179,6 +312,78 @@ def normalize_url(url, unsplit=True, sort_query=True, strip_authentication=True,
         string: The normalized url.
 
     """
+    options = NormalizeUrlOptions(
+        unsplit,
+        sort_query,
+        strip_authentication,
+        strip_trailing_slash,
+        strip_index,
+        strip_protocol,
+        strip_irrelevant_subdomains,
+        strip_lang_subdomains,
+        strip_lang_query_items,
+        strip_fragment,
+        normalize_amp,
+        fix_common_mistakes,
+        infer_redirection,
+        quoted
+    )
+
+    if isinstance(url, SplitResult):
+        return normalize_url_with_options(url, options)
+
+    return cached_normalize_url(url, options)
+
+
+def normalize_urls(urls, **kwargs):
+    """
+    Function normalizing the given urls in a single batch. This is more
+    efficient than calling `normalize_url` in a loop since options are only
+    processed once.
+
+    Args:
+        urls (iterable): Target URLs as strings.
+        **kwargs: Any keyword argument accepted by `normalize_url`.
+
+    Returns:
+        list: The normalized urls.
+
+    """
+    options = NormalizeUrlOptions(**kwargs)
+
+    return [
+        normalize_url_with_options(url, options)
+        if isinstance(url, SplitResult)
+        else cached_normalize_url(url, options)
+        for url in urls
+    ]
+
+
+# NOTE: urls are often normalized many times over when deduplicating
+# urls shared on social media, hence the cache
+@lru_cache(maxsize=NORMALIZE_URL_CACHE_SIZE)
+def cached_normalize_url(url, options):
+    return normalize_url_with_options(url, options)
+
+
+def normalize_url_with_options(url, options):
+    (
+        unsplit,
+        sort_query,
+        strip_authentication,
+        strip_trailing_slash,
+        strip_index,
+        strip_protocol,
+        strip_irrelevant_subdomains,
+        strip_lang_subdomains,
+        strip_lang_query_items,
+        strip_fragment,
+        normalize_amp,
+        fix_common_mistakes,
+        infer_redirection,
+        quoted
+    ) = options
+
     original_url_arg = url
 
     if infer_redirection:
@@ -204,8 +409,8 @@ def normalize_url(url, unsplit=True, sort_query=True, strip_authentication=True,
 
     # Fixing common mistakes
     if fix_common_mistakes:
-        if query:
-            query = re.sub(MISTAKES_RE, '&', query)
+        if query and ('&a' in query or '&A' in query):
+            query = MISTAKES_RE.sub('&', query)
 
     # Handling punycode
     netloc = decode_punycode_hostname(netloc)
@@ -227,46 +432,56 @@ def normalize_url(url, unsplit=True, sort_query=True, strip_authentication=True,
 
     # Handling Google AMP suffixes
     if normalize_amp:
-        path = AMP_SUFFIXES_RE.sub('', path)
+        path = strip_amp_suffixes_from_path(path)
 
     # Dropping index:
     if strip_index:
-        segments = path.rsplit('/', 1)
-
-        if len(segments) != 0:
-            last_segment = segments[-1]
-            filename, ext = splitext(last_segment)
+        last_slash = path.rfind('/')
+        last_segment = path[last_slash + 1:]
 
-            if filename == 'index':
-                segments.pop()
-                path = '/'.join(segments)
+        # NOTE: same as testing that os.path.splitext returns "index"
+        if last_segment == 'index' or (
+            last_segment.startswith('index.') and
+            '.' not in last_segment[6:]
+        ):
+            path = path[:last_slash] if last_slash != -1 else ''
 
     # Dropping irrelevant query items
     if query:
         domain_filter = None
+        hostname = splitted.hostname
 
-        if splitted.hostname:
+        if hostname:
             domain_filter = next(
-                (f for d, f in PER_DOMAIN_QUERY_FILTERS if splitted.hostname.endswith(d)),
+                (f for d, f in PER_DOMAIN_QUERY_FILTERS if hostname.endswith(d)),
                 None
             )
 
-        qsl = parse_qsl(query, keep_blank_values=True)
-        qsl = [
-            stringify_qs(item)
-            for item in qsl
-            if not should_strip_query_item(
-                item,
-                normalize_amp=normalize_amp,
-                strip_lang_query_items=strip_lang_query_items,
-                domain_filter=domain_filter
-            )
-        ]
+        # Fast path: the query would be kept as-is
+        can_skip_query = (
+            (not sort_query or '&' not in query) and
+            not strip_lang_query_items and
+            domain_filter is None and
+            not QUERY_TO_PROCESS_RE.search(query)
+        )
 
-        if sort_query:
-            qsl = sorted(qsl)
+        if not can_skip_query:
+            qsl = parse_qsl(query, keep_blank_values=True)
+            qsl = [
+                stringify_qs(item)
+                for item in qsl
+                if not should_strip_query_item(
+                    item,
+                    normalize_amp=normalize_amp,
+                    strip_lang_query_items=strip_lang_query_items,
+                    domain_filter=domain_filter
+                )
+            ]
 
-        query = '&'.join(qsl)
+            if sort_query:
+                qsl = sorted(qsl)
+
+            query = '&'.join(qsl)
 
     # Dropping fragment if it's not routing
     if fragment and strip_fragment:
@@ -279,11 +494,7 @@ def normalize_url(url, unsplit=True, sort_query=True, strip_authentication=True,
 
     # Dropping irrelevant subdomains
     if strip_irrelevant_subdomains:
-        netloc = re.sub(
-            IRRELEVANT_SUBDOMAIN_AMP_RE if normalize_amp else IRRELEVANT_SUBDOMAIN_RE,
-            '',
-            netloc
-        )
+        netloc = strip_irrelevant_subdomains_from_netloc(netloc, normalize_amp=normalize_amp)
 
     # Dropping language as subdomains
     if strip_lang_subdomains:
@@ -306,34 +517,65 @@ def normalize_url(url, unsplit=True, sort_query=True, strip_authentication=True,
         path = path.rstrip('/')
 
     # Quoting or not
+    # NOTE: most components are already in the desired form, and a single
+    # rstrip is enough to check whether quoting would change anything
     if quoted:
-        path = quote(path)
-        query = quote(query, RESERVED_CHARACTERS)
-        fragment = quote(fragment, SAFE_CHARACTERS)
+        if path.rstrip(ALWAYS_SAFE_PATH_CHARACTERS):
+            path = quote(path)
+        if query.rstrip(ALWAYS_SAFE_QUERY_CHARACTERS):
+            query = quote(query, RESERVED_CHARACTERS)
+        if fragment.rstrip(ALWAYS_SAFE_FRAGMENT_CHARACTERS):
+            fragment = quote(fragment, SAFE_CHARACTERS)
     else:
-        path = unquote(path)
-        query = unquote(query)
-        fragment = unquote(fragment)
+        if '%' in path:
+            path = unquote(path)
+        if '%' in query:
+            query = unquote(query)
+        if '%' in fragment:
+            fragment = unquote(fragment)
 
-    # Result
-    result = SplitResult(
-        scheme,
-        netloc.lower(),
-        path,
-        query,
-        fragment
-    )
+    netloc = netloc.lower()
 
     if not unsplit:
+        return SplitResult(scheme, netloc, path, query, fragment)
+
+    # NOTE: urls without netloc are rare and handled by urlunsplit in
+    # its own peculiar way
+    if not netloc:
+        result = urlunsplit((scheme, netloc, path, query, fragment))
+
+        if strip_protocol or not has_protocol:
+            result = result[2:]
+
         return result
 
-    # TODO: check if works with `unsplit=False`
-    if strip_protocol or not has_protocol:
-        result = urlunsplit(result)[2:]
-    else:
-        result = urlunsplit(result)
+    # Result
+    parts = []
+
+    if not strip_protocol and has_protocol:
+        if scheme:
+            parts.append(scheme)
+            parts.append(':')
 
-    return result
+        parts.append('//')
+
+    parts.append(netloc)
+
+    if path:
+        if path[0] != '/':
+            parts.append('/')
+
+        parts.append(path)
+
+    if query:
+        parts.append('?')
+        parts.append(query)
+
+    if fragment:
+        parts.append('#')
+        parts.append(fragment)
+
+    return ''.join(parts)
 
 
 def get_normalized_hostname(url, normalize_amp=True, strip_lang_subdomains=False,
@@ -355,9 +597,7 @@ def get_normalized_hostname(url, normalize_amp=True, strip_lang_subdomains=False
 
     hostname = splitted.hostname.lower()
 
-    pattern = IRRELEVANT_SUBDOMAIN_AMP_RE if normalize_amp else IRRELEVANT_SUBDOMAIN_RE
-
-    hostname = pattern.sub('', hostname)
+    hostname = strip_irrelevant_subdomains_from_netloc(hostname, normalize_amp=normalize_amp)
 
     if normalize_amp and hostname.startswith('amp-'):
         hostname = hostname[4:]
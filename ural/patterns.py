@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 import re
+import sys
 
 PROTOCOL = r'[a-zA-Z]{0,64}:?//'
 WEB_PROTOCOL = r'(?:(?:(?:https?|ftp|wss?):)?//)'
@@ -61,20 +62,41 @@ RELAXED_RESOURCE_PATH = r"(?:[/?#][\S ]*)?"
 
 SPECIAL_HOSTS_RE = re.compile(r'^localhost|(\d{1,3}\.){3}\d{1,3}|\[[\da-f]*:[\da-f:]*\]$', re.I)
 
-URL_RE = re.compile(
-    r'^(?:%s)?%s$' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE)
+# NOTE: the following patterns are costly to compile because of their wide
+# case-insensitive unicode ranges, so they are only compiled when first
+# accessed, through the module's __getattr__ below
+LAZY_PATTERNS = {
+    'URL_RE': (
+        r'^(?:%s)?%s$' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE),
 
-URL_WITH_PROTOCOL_RE = re.compile(
-    r'^%s%s$' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE)
+    'URL_WITH_PROTOCOL_RE': (
+        r'^%s%s$' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE),
 
-RELAXED_URL = re.compile(
-    r'^(?:%s)?%s$' % (PROTOCOL, URL + RELAXED_RESOURCE_PATH), re.I | re.UNICODE)
+    'RELAXED_URL': (
+        r'^(?:%s)?%s$' % (PROTOCOL, URL + RELAXED_RESOURCE_PATH), re.I | re.UNICODE),
 
-RELAXED_URL_WITH_PROTOCOL_RE = re.compile(
-    r'^%s%s$' % (PROTOCOL, URL + RELAXED_RESOURCE_PATH), re.I | re.UNICODE)
+    'RELAXED_URL_WITH_PROTOCOL_RE': (
+        r'^%s%s$' % (PROTOCOL, URL + RELAXED_RESOURCE_PATH), re.I | re.UNICODE),
 
-URL_IN_TEXT_RE = re.compile(
-    r'(%s)%s' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE)
+    'URL_IN_TEXT_RE': (
+        r'(%s)%s' % (PROTOCOL, URL + RESOURCE_PATH), re.I | re.UNICODE)
+}
+
+
+def __getattr__(name):
+    if name not in LAZY_PATTERNS:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+    pattern = re.compile(*LAZY_PATTERNS[name])
+    globals()[name] = pattern
+
+    return pattern
+
+
+# PY2/PY3 compatible: module __getattr__ only exists since python 3.7
+if sys.version_info < (3, 7):
+    for name in LAZY_PATTERNS:
+        globals()[name] = re.compile(*LAZY_PATTERNS[name])
 
 URL_IN_HTML_RE = re.compile(
     r"<a\s.*?href=(?:\"([.#]+?)\"|\'([.#]+?)\'|([^\s]+?))(?:>|\s.*?>)(?:.*?)<[/ ]?a>",
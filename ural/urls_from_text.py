@@ -5,9 +5,7 @@
 #
 # A function returning an iterator over the urls present in the string argument.
 #
-import re
-
-from ural.patterns import URL_IN_TEXT_RE
+from ural import patterns
 
 IRRELEVANT_PUNCTUATION = set('!?#"$%&\'()*+,-.:;<=>@[\\]^_`{|}~…’‘`‛«»„‟“”-‐‒–—―−‑⁃,،、')
 
@@ -23,7 +21,7 @@ def urls_from_text(string):
         str: an url.
 
     """
-    for match in re.finditer(URL_IN_TEXT_RE, string):
+    for match in patterns.URL_IN_TEXT_RE.finditer(string):
         url = match.group(0)
 
         last_punct = None
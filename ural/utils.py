@@ -58,6 +58,16 @@ except ImportError:
         SplitResult
     )
 
+# PY2/PY3 compatible lru_cache, caching nothing on PY2
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize=128):
+        def decorator(fn):
+            return fn
+
+        return decorator
+
 
 def safe_urlsplit(url, scheme='http'):
     if isinstance(url, SplitResult):
@@ -82,27 +92,34 @@ def urlpathsplit(urlpath):
     return urlpath.split('/')
 
 
-SLASH_SQUEEZE_RE = re.compile(r'\/{2,}')
-
-
 def normpath(urlpath, drop_consecutive_slashes=True):
-    if drop_consecutive_slashes:
-        urlpath = SLASH_SQUEEZE_RE.sub('/', urlpath)
+
+    # Fast path: no consecutive slashes nor dot segments
+    if '//' not in urlpath and '/.' not in urlpath and not urlpath.startswith('.'):
+        return urlpath.rstrip('/')
 
     segments = urlpath.split('/')
-    segments = [segment + '/' for segment in segments[:-1]] + [segments[-1]]
+    last = len(segments) - 1
     resolved = []
 
-    for segment in segments:
-        if segment in ('../', '..'):
+    for i, segment in enumerate(segments):
+        if segment == '..':
             if resolved[1:]:
                 resolved.pop()
-        elif segment not in ('./', '.'):
+        elif segment == '.':
+            continue
+
+        # NOTE: empty inner segments come from consecutive slashes
+        elif not segment and drop_consecutive_slashes and 0 < i < last:
+            continue
+        else:
             resolved.append(segment)
 
-    return ''.join(resolved).rstrip('/')
+    return '/'.join(resolved).rstrip('/')
 
 
+# NOTE: the same labels tend to be found over and over across urls
+@lru_cache(maxsize=4096)
 def attempt_to_decode_idna(string):
     try:
         return string.encode('utf8').decode('idna')
@@ -111,9 +128,14 @@ def attempt_to_decode_idna(string):
 
 
 def decode_punycode_hostname(hostname):
-    if 'xn--' in hostname:
-        hostname = '.'.join(
-            attempt_to_decode_idna(x) for x in hostname.split('.')
-        )
+    if 'xn--' not in hostname:
+        return hostname
 
-    return hostname
+    # NOTE: punycode can only be found at the beginning of a label
+    if not hostname.startswith('xn--') and '.xn--' not in hostname:
+        return hostname
+
+    return '.'.join(
+        attempt_to_decode_idna(x) if x.startswith('xn--') else x
+        for x in hostname.split('.')
+    )